@@ -6,14 +6,162 @@ from SEC EDGAR filings using the edgartools package's XBRL and XBRLS classes.
 """
 
 from typing import Dict, List, Optional, Union, Any
+import asyncio
+import hashlib
+import weakref
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import cached_property, reduce
+import operator
+import os
+import orjson
+import pickle
+import threading
+import time
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
 
+from pandas.api.types import union_categoricals
+
+# With copy-on-write, derived frames share blocks with their parents until
+# modified, so attaching metadata columns no longer forces full copies
+pd.set_option('mode.copy_on_write', True)
+
 from edgar import Company
+from edgar.storage import is_using_local_storage
 from edgar.xbrl import XBRL, XBRLS
+from edgar.xbrl.xbrl import XBRLAttachments
 from edgar._filings import Filings
 
+# Directory for the cross-session processed-statement cache
+_DISK_CACHE_DIR = os.path.expanduser("~/.edgartools_cache")
+
+# Maps statement type names to the accessor method on a Statements object.
+# Types not listed here fall back to indexed lookup (statements[type]).
+_STATEMENT_DISPATCH = {
+    'BalanceSheet': 'balance_sheet',
+    'IncomeStatement': 'income_statement',
+    'CashFlowStatement': 'cashflow_statement',
+    'StatementOfEquity': 'statement_of_equity',
+    'ComprehensiveIncome': 'comprehensive_income_statement'
+}
+
+# attrgetter compiles each accessor lookup once at import time, replacing a
+# per-call getattr with a C-level attribute fetch
+_STATEMENT_GETTERS = {k: operator.attrgetter(v) for k, v in _STATEMENT_DISPATCH.items()}
+
+
+def _arrowify(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a statement DataFrame to pyarrow-backed dtypes.
+
+    XBRL statements are mostly string labels and sparse numerics; arrow
+    backing stores strings compactly and keeps integers integral instead of
+    NaN-upcasting them to float, typically shrinking cached frames 2-4x.
+
+    Args:
+        df (pd.DataFrame): Freshly materialized statement DataFrame
+
+    Returns:
+        pd.DataFrame: Arrow-backed DataFrame (or the original if conversion fails)
+    """
+    try:
+        return df.convert_dtypes(dtype_backend='pyarrow')
+    except Exception:
+        # Exotic object columns occasionally resist conversion; the plain
+        # frame is still usable, just bigger
+        return df
+
+
+def _concat_statement_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate per-filing statement DataFrames without redundant copies.
+
+    Category columns are unified across frames first, so pd.concat keeps
+    them categorical instead of silently falling back to object dtype.
+
+    Args:
+        frames (List[pd.DataFrame]): Per-filing statement DataFrames
+
+    Returns:
+        pd.DataFrame: Combined DataFrame with a fresh integer index
+    """
+    if not frames:
+        return pd.DataFrame()
+
+    # Unify categories for columns that are categorical in every frame
+    category_columns = set(frames[0].select_dtypes(include='category').columns)
+    for df in frames[1:]:
+        category_columns &= set(df.select_dtypes(include='category').columns)
+
+    for col in category_columns:
+        unified = union_categoricals([df[col] for df in frames])
+        offset = 0
+        for df in frames:
+            df[col] = unified[offset:offset + len(df)]
+            offset += len(df)
+
+    return pd.concat(frames, ignore_index=True, copy=False)
+
+
+class LazyStatementRecord:
+    """
+    Holds an extracted statement and materializes its DataFrame on demand.
+
+    statement.to_dataframe() is a non-trivial transformation over XBRL facts,
+    so it is deferred until a caller actually needs tabular data and cached
+    after the first access.
+
+    Attributes:
+        statement: The underlying statement object
+        filing_date: Filing date (individual filings only)
+        accession_number (str): Accession number (individual filings only)
+    """
+
+    def __init__(self, statement, filing_date=None, accession_number: Optional[str] = None):
+        self.statement = statement
+        self.filing_date = filing_date
+        self.accession_number = accession_number
+
+    @cached_property
+    def dataframe(self) -> pd.DataFrame:
+        return _arrowify(self.statement.to_dataframe())
+
+    @classmethod
+    def from_dataframe(cls, dataframe: pd.DataFrame, filing_date=None,
+                       accession_number: Optional[str] = None) -> 'LazyStatementRecord':
+        """Build a record around an already-materialized DataFrame."""
+        record = cls(None, filing_date, accession_number)
+        # Pre-seed the cached_property so .dataframe never touches .statement
+        record.__dict__['dataframe'] = dataframe
+        return record
+
+
+class _BoundedCache(OrderedDict):
+    """
+    Dict with least-recently-used eviction, holding at most maxsize entries.
+
+    Keeps hot processed-statement results available while preventing the
+    cache from growing without bound across (filing_type, years) combinations.
+    """
+
+    def __init__(self, maxsize: int = 16):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
 
 class FinancialStatementProcessor:
     """
@@ -34,24 +182,33 @@ class FinancialStatementProcessor:
         filings_cache (Dict): Cache for retrieved filings
         processed_statements (Dict): Cache for processed statements
     """
-    
-    def __init__(self, 
-                 company_ticker: str, 
+
+    __slots__ = ('company_ticker', 'max_years', 'include_quarterly', 'cache_max_age_days',
+                 'statement_types', '_company', '_company_lock', 'filings_cache',
+                 '_statement_types_set', 'processed_statements', '_xbrl_cache',
+                 '_summary_cache', 'logger')
+
+    def __init__(self,
+                 company_ticker: str,
                  max_years: int = 5,
                  statement_types: Optional[List[str]] = None,
-                 include_quarterly: bool = True):
+                 include_quarterly: bool = True,
+                 cache_max_age_days: int = 30):
         """
         Initialize the Financial Statement Processor.
-        
+
         Args:
             company_ticker (str): Company ticker symbol (e.g., 'AAPL', 'MSFT')
             max_years (int): Maximum number of years to retrieve (default: 5)
             statement_types (List[str], optional): Statement types to process
             include_quarterly (bool): Whether to include quarterly filings
+            cache_max_age_days (int): Maximum age of on-disk cache entries before
+                                      they are refreshed (default: 30)
         """
         self.company_ticker = company_ticker.upper()
         self.max_years = max_years
         self.include_quarterly = include_quarterly
+        self.cache_max_age_days = cache_max_age_days
         
         # Default statement types if not provided
         if statement_types is None:
@@ -64,20 +221,263 @@ class FinancialStatementProcessor:
             ]
         else:
             self.statement_types = statement_types
-            
-        # Initialize company object
-        try:
-            self.company = Company(self.company_ticker)
-        except Exception as e:
-            raise ValueError(f"Unable to find company with ticker '{self.company_ticker}': {e}")
-            
-        # Initialize caches
-        self.filings_cache = {}
-        self.processed_statements = {}
+
+        # Frozen set alongside the list for O(1) membership checks
+        self._statement_types_set = frozenset(self.statement_types)
+
+        # Company object is constructed lazily on first access (see company),
+        # so building a processor never hits EDGAR by itself
+        self._company = None
+        self._company_lock = threading.Lock()
+
+        # Initialize caches. Filings are held weakly so cold entries can be
+        # collected, and processed statements are capped with LRU eviction
+        self.filings_cache = weakref.WeakValueDictionary()
+        self.processed_statements = _BoundedCache(maxsize=16)
+        # Parsed XBRL objects keyed by accession number, so the same filing
+        # is never parsed twice across different years/stitching combinations.
+        # Parse trees are large, so keep only a handful pinned at once
+        self._xbrl_cache: Dict[str, XBRL] = _BoundedCache(maxsize=8)
+        # (monotonic timestamp, summary dict) - see get_summary_info
+        self._summary_cache = None
         
         # Set up logging
         self.logger = logging.getLogger(f"FinancialProcessor-{self.company_ticker}")
-        
+
+    @property
+    def company(self) -> Company:
+        """Edgar Company object, constructed on first access."""
+        if self._company is None:
+            with self._company_lock:
+                if self._company is None:
+                    try:
+                        self._company = Company(self.company_ticker)
+                    except Exception as e:
+                        raise ValueError(f"Unable to find company with ticker '{self.company_ticker}': {e}")
+        return self._company
+
+    # Maximum number of filings fetched from EDGAR concurrently.
+    # SEC allows ~10 requests/second, so stay comfortably below that.
+    _MAX_CONCURRENT_FETCHES = 8
+
+    def _get_statement(self, statements, statement_type: str):
+        """
+        Retrieve a single statement from a Statements object by type name.
+
+        Args:
+            statements: Statements object (stitched or single-filing)
+            statement_type (str): Statement type name (e.g., 'BalanceSheet')
+
+        Returns:
+            The statement object, or None if not available
+        """
+        getter = _STATEMENT_GETTERS.get(statement_type)
+        if getter is not None:
+            # Not every Statements implementation exposes every accessor
+            # (per-filing Statements has no comprehensive_income_statement)
+            with suppress(AttributeError):
+                return getter(statements)()
+        # Fall back to indexed lookup for types this processor was
+        # configured with; missing ones are expected
+        if statement_type in self._statement_types_set:
+            with suppress(AttributeError, KeyError):
+                return statements[statement_type]
+        return None
+
+    def _disk_cache_path(self, cache_key: str) -> str:
+        """Build the on-disk cache file path for a processed-statements key."""
+        key = f"{self.company_ticker}_{cache_key}_{'-'.join(self.statement_types)}"
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return os.path.join(_DISK_CACHE_DIR, f"{self.company_ticker}_{digest}.pkl")
+
+    def _load_from_disk_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load processed statements from the on-disk cache, if enabled and fresh.
+
+        Args:
+            cache_key (str): Cache key used by extract_multi_year_statements
+
+        Returns:
+            Dict[str, Any] or None: Cached statements data, or None on a miss
+        """
+        if not is_using_local_storage():
+            return None
+
+        filepath = self._disk_cache_path(cache_key)
+        if not os.path.exists(filepath):
+            return None
+
+        # Invalidate stale entries so new filings are eventually picked up
+        age_days = (datetime.now().timestamp() - os.path.getmtime(filepath)) / 86400
+        if age_days > self.cache_max_age_days:
+            self.logger.info("Disk cache entry for %s expired (%.1f days old)", cache_key, age_days)
+            return None
+
+        try:
+            with open(filepath, 'rb') as f:
+                payload = pickle.load(f)
+
+            # Rebuild records around the persisted DataFrames; the original
+            # statement objects are deliberately not part of the payload
+            statements_data = {}
+            for statement_type, entry in payload.items():
+                if entry['type'] == 'stitched':
+                    statements_data[statement_type] = {
+                        'record': LazyStatementRecord.from_dataframe(entry['dataframe']),
+                        'periods': entry['periods'],
+                        'type': 'stitched'
+                    }
+                else:
+                    statements_data[statement_type] = {
+                        'statements': [
+                            LazyStatementRecord.from_dataframe(
+                                item['dataframe'],
+                                filing_date=item['filing_date'],
+                                accession_number=item['accession_number']
+                            )
+                            for item in entry['statements']
+                        ],
+                        'periods': entry['periods'],
+                        'type': 'individual'
+                    }
+
+            self.logger.info("Loaded %s from disk cache", cache_key)
+            return statements_data
+        except Exception as e:
+            self.logger.warning("Could not read disk cache entry %s: %s", filepath, e)
+            return None
+
+    def _save_to_disk_cache(self, cache_key: str, statements_data: Dict[str, Any]) -> None:
+        """
+        Persist processed statements to the on-disk cache, if enabled.
+
+        Only materialized DataFrames plus record metadata are pickled; the
+        statement objects drag in full XBRL parse state, which is huge and
+        not reliably picklable.
+        """
+        if not is_using_local_storage():
+            return
+
+        try:
+            self.materialize_all(statements_data)
+            payload = {}
+            for statement_type, info in statements_data.items():
+                entry = {'periods': info['periods'], 'type': info['type']}
+                if info['type'] == 'stitched':
+                    entry['dataframe'] = info['record'].dataframe
+                else:
+                    entry['statements'] = [
+                        {'dataframe': record.dataframe,
+                         'filing_date': record.filing_date,
+                         'accession_number': record.accession_number}
+                        for record in info['statements']
+                    ]
+                payload[statement_type] = entry
+
+            os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+            with open(self._disk_cache_path(cache_key), 'wb') as f:
+                pickle.dump(payload, f)
+        except Exception as e:
+            self.logger.warning("Could not write disk cache entry for %s: %s", cache_key, e)
+
+    # Parse order matters: the instance document must be parsed last
+    _XBRL_DOC_TYPES = ('schema', 'label', 'presentation', 'calculation', 'definition', 'instance')
+
+    @staticmethod
+    def _download_xbrl_contents(filing) -> Optional[Dict[str, str]]:
+        """
+        Download the XBRL document contents for a filing (network stage).
+
+        Args:
+            filing: Filing object with attachments containing XBRL files
+
+        Returns:
+            Dict[str, str] or None: Document contents keyed by document type,
+                                    or None if the filing has no XBRL data
+        """
+        xbrl_attachments = XBRLAttachments(filing.attachments)
+        if xbrl_attachments.empty:
+            return None
+
+        contents = {}
+        for doc_type in FinancialStatementProcessor._XBRL_DOC_TYPES:
+            attachment = xbrl_attachments.get(doc_type)
+            if attachment is not None:
+                contents[doc_type] = attachment.content
+        return contents
+
+    @staticmethod
+    def _build_xbrl(contents: Dict[str, str]) -> XBRL:
+        """
+        Parse downloaded XBRL document contents into an XBRL object (CPU stage).
+
+        Args:
+            contents (Dict[str, str]): Output of _download_xbrl_contents
+
+        Returns:
+            XBRL: Parsed XBRL object
+        """
+        xbrl = XBRL()
+        parser = xbrl.parser
+        parse_methods = {
+            'schema': parser.parse_schema_content,
+            'label': parser.parse_labels_content,
+            'presentation': parser.parse_presentation_content,
+            'calculation': parser.parse_calculation_content,
+            'definition': parser.parse_definition_content,
+            'instance': parser.parse_instance_content
+        }
+        for doc_type in FinancialStatementProcessor._XBRL_DOC_TYPES:
+            if doc_type in contents:
+                parse_methods[doc_type](contents[doc_type])
+        return xbrl
+
+    async def _process_filing_async(self, filing, semaphore: asyncio.Semaphore):
+        """
+        Load the XBRL data for a single filing without blocking the event loop.
+
+        The network stage (downloading the filing's XBRL documents) runs under
+        the rate-limiting semaphore; the CPU-bound parse runs outside it, so a
+        slow parse never holds back other filings' downloads.
+
+        Args:
+            filing: Filing object to process
+            semaphore (asyncio.Semaphore): Limits concurrent EDGAR requests
+
+        Returns:
+            XBRL: Parsed XBRL object (or None if the filing has no XBRL data)
+        """
+        accession_no = filing.accession_no
+        if accession_no in self._xbrl_cache:
+            return self._xbrl_cache[accession_no]
+
+        async with semaphore:
+            contents = await asyncio.to_thread(self._download_xbrl_contents, filing)
+
+        if contents is None:
+            return None
+
+        xbrl = await asyncio.to_thread(self._build_xbrl, contents)
+
+        if xbrl is not None:
+            self._xbrl_cache[accession_no] = xbrl
+        return xbrl
+
+    async def _load_filing_xbrls(self, filings: List[Any]) -> List[Any]:
+        """
+        Concurrently load XBRL data for a list of filings.
+
+        Args:
+            filings (List[Any]): Filing objects to process
+
+        Returns:
+            List[Any]: One entry per filing, in order - either an XBRL object,
+                       None, or the Exception raised while loading that filing
+        """
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_FETCHES)
+        tasks = [self._process_filing_async(filing, semaphore) for filing in filings]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
     def get_annual_filings(self, years: Optional[int] = None) -> Filings:
         """
         Retrieve annual 10-K filings for the specified number of years.
@@ -92,16 +492,19 @@ class FinancialStatementProcessor:
             years = self.max_years
             
         cache_key = f"10-K_{years}"
-        if cache_key not in self.filings_cache:
+        # .get keeps a strong reference; a weakly-held entry could be
+        # collected between a membership check and a separate lookup
+        filings = self.filings_cache.get(cache_key)
+        if filings is None:
             try:
                 filings = self.company.get_filings(form="10-K").head(years)
                 self.filings_cache[cache_key] = filings
-                self.logger.info(f"Retrieved {len(filings)} annual filings for {self.company_ticker}")
+                self.logger.info("Retrieved %d annual filings for %s", len(filings), self.company_ticker)
             except Exception as e:
-                self.logger.error(f"Error retrieving annual filings: {e}")
+                self.logger.error("Error retrieving annual filings: %s", e)
                 raise
-                
-        return self.filings_cache[cache_key]
+
+        return filings
     
     def get_quarterly_filings(self, quarters: int = 12) -> Filings:
         """
@@ -114,16 +517,17 @@ class FinancialStatementProcessor:
             Filings: Collection of quarterly filings
         """
         cache_key = f"10-Q_{quarters}"
-        if cache_key not in self.filings_cache:
+        filings = self.filings_cache.get(cache_key)
+        if filings is None:
             try:
                 filings = self.company.get_filings(form="10-Q").head(quarters)
                 self.filings_cache[cache_key] = filings
-                self.logger.info(f"Retrieved {len(filings)} quarterly filings for {self.company_ticker}")
+                self.logger.info("Retrieved %d quarterly filings for %s", len(filings), self.company_ticker)
             except Exception as e:
-                self.logger.error(f"Error retrieving quarterly filings: {e}")
+                self.logger.error("Error retrieving quarterly filings: %s", e)
                 raise
-                
-        return self.filings_cache[cache_key]
+
+        return filings
     
     def extract_multi_year_statements(self, 
                                     filing_type: str = "10-K",
@@ -146,7 +550,13 @@ class FinancialStatementProcessor:
         cache_key = f"{filing_type}_{years}_{use_stitching}"
         if cache_key in self.processed_statements:
             return self.processed_statements[cache_key]
-            
+
+        # Fall back to the cross-session disk cache before hitting EDGAR
+        disk_cached = self._load_from_disk_cache(cache_key)
+        if disk_cached is not None:
+            self.processed_statements[cache_key] = disk_cached
+            return disk_cached
+
         try:
             # Get appropriate filings
             if filing_type == "10-K":
@@ -156,94 +566,88 @@ class FinancialStatementProcessor:
             else:
                 raise ValueError(f"Unsupported filing type: {filing_type}")
                 
-            if len(filings) == 0:
+            num_filings = len(filings)
+            if num_filings == 0:
                 raise ValueError(f"No {filing_type} filings found for {self.company_ticker}")
-                
+
             statements_data = {}
-            
-            if use_stitching and len(filings) > 1:
+
+            if use_stitching and num_filings > 1:
                 # Use XBRLS for multi-period stitching
-                self.logger.info(f"Using XBRLS stitching for {len(filings)} {filing_type} filings")
-                xbrls = XBRLS.from_filings(list(filings))
+                self.logger.info("Using XBRLS stitching for %d %s filings", num_filings, filing_type)
+                # from_filings only sorts, so pass the Filings collection
+                # directly instead of materializing an extra list
+                xbrls = XBRLS.from_filings(filings)
                 stitched_statements = xbrls.statements
-                
+
                 # Extract each statement type
                 for statement_type in self.statement_types:
                     try:
-                        if statement_type == 'BalanceSheet':
-                            statement = stitched_statements.balance_sheet()
-                        elif statement_type == 'IncomeStatement':
-                            statement = stitched_statements.income_statement()
-                        elif statement_type == 'CashFlowStatement':
-                            statement = stitched_statements.cashflow_statement()
-                        elif statement_type == 'StatementOfEquity':
-                            statement = stitched_statements.statement_of_equity()
-                        elif statement_type == 'ComprehensiveIncome':
-                            statement = stitched_statements.comprehensive_income_statement()
-                        else:
-                            # Try to get any other statement type
-                            statement = stitched_statements[statement_type]
-                            
+                        statement = self._get_statement(stitched_statements, statement_type)
+
                         if statement is not None:
+                            periods = getattr(statement, 'periods', None)
                             statements_data[statement_type] = {
-                                'statement': statement,
-                                'dataframe': statement.to_dataframe(),
-                                'periods': len(statement.periods) if hasattr(statement, 'periods') else 1,
+                                'record': LazyStatementRecord(statement),
+                                'periods': len(periods) if periods is not None else 1,
                                 'type': 'stitched'
                             }
-                            self.logger.info(f"Successfully extracted stitched {statement_type}")
+                            self.logger.info("Successfully extracted stitched %s", statement_type)
                         else:
-                            self.logger.warning(f"No {statement_type} found in stitched statements")
+                            self.logger.warning("No %s found in stitched statements", statement_type)
                             
                     except Exception as e:
-                        self.logger.error(f"Error extracting stitched {statement_type}: {e}")
+                        self.logger.error("Error extracting stitched %s: %s", statement_type, e)
                         continue
                         
             else:
-                # Process individual filings
-                self.logger.info(f"Processing {len(filings)} individual {filing_type} filings")
-                individual_statements = {}
-                
-                for i, filing in enumerate(filings):
+                # Process individual filings, fetching their XBRL data concurrently
+                filings_list = list(filings)
+                self.logger.info("Processing %d individual %s filings", len(filings_list), filing_type)
+                individual_statements = defaultdict(list)
+
+                xbrl_results = asyncio.run(self._load_filing_xbrls(filings_list))
+
+                for i, (filing, xbrl) in enumerate(zip(filings_list, xbrl_results)):
+                    if isinstance(xbrl, Exception):
+                        self.logger.error("Error processing filing %d: %s", i, xbrl)
+                        continue
+                    if xbrl is None:
+                        self.logger.warning("XBRL object is None for filing %d, skipping.", i)
+                        continue
+
+                    # One try frame per filing: _get_statement treats missing
+                    # statement types as None, so exceptions here are unexpected
+                    statement_type = None
                     try:
-                        xbrl = XBRL.from_filing(filing)
-                        if xbrl is None:
-                            self.logger.warning(f"XBRL object is None for filing {i}, skipping.")
-                            continue
                         filing_statements = xbrl.statements
-                        
+                        # Resolve each accessor once per filing instead of
+                        # once per (filing, statement type) pair; accessors
+                        # this Statements implementation doesn't expose bind
+                        # to None and fall back to _get_statement below
+                        bound_accessors = {
+                            stype: getattr(filing_statements, _STATEMENT_DISPATCH[stype], None)
+                            for stype in self.statement_types if stype in _STATEMENT_DISPATCH
+                        }
+
                         for statement_type in self.statement_types:
-                            if statement_type not in individual_statements:
-                                individual_statements[statement_type] = []
-                                
-                            try:
-                                if statement_type == 'BalanceSheet':
-                                    statement = filing_statements.balance_sheet()
-                                elif statement_type == 'IncomeStatement':
-                                    statement = filing_statements.income_statement()
-                                elif statement_type == 'CashFlowStatement':
-                                    statement = filing_statements.cashflow_statement()
-                                elif statement_type == 'StatementOfEquity':
-                                    statement = filing_statements.statement_of_equity()
-                                elif statement_type == 'ComprehensiveIncome':
-                                    statement = filing_statements.comprehensive_income_statement()
-                                else:
-                                    statement = filing_statements[statement_type]
-                                    
-                                if statement is not None:
-                                    individual_statements[statement_type].append({
-                                        'filing_date': filing.filing_date,
-                                        'accession_number': filing.accession_no,
-                                        'statement': statement,
-                                        'dataframe': statement.to_dataframe()
-                                    })
-                                    
-                            except Exception as e:
-                                self.logger.warning(f"Error extracting {statement_type} from filing {i}: {e}")
-                                continue
-                                
+                            accessor = bound_accessors.get(statement_type)
+                            if accessor is not None:
+                                statement = accessor()
+                            else:
+                                statement = self._get_statement(filing_statements, statement_type)
+
+                            if statement is not None:
+                                individual_statements[statement_type].append(
+                                    LazyStatementRecord(
+                                        statement,
+                                        filing_date=filing.filing_date,
+                                        accession_number=filing.accession_no
+                                    )
+                                )
+
                     except Exception as e:
-                        self.logger.error(f"Error processing filing {i}: {e}")
+                        self.logger.warning("Error extracting %s from filing %d: %s", statement_type, i, e)
                         continue
                         
                 # Convert individual statements to organized format
@@ -257,26 +661,55 @@ class FinancialStatementProcessor:
                         
             # Cache the results
             self.processed_statements[cache_key] = statements_data
-            
-            self.logger.info(f"Successfully extracted {len(statements_data)} statement types")
+            self._save_to_disk_cache(cache_key, statements_data)
+
+
+            self.logger.info("Successfully extracted %d statement types", len(statements_data))
             return statements_data
             
         except Exception as e:
-            self.logger.error(f"Error extracting multi-year statements: {e}")
+            self.logger.error("Error extracting multi-year statements: %s", e)
             raise
             
-    def get_trend_analysis_data(self, 
+    def materialize_all(self, statements_data: Dict[str, Any]) -> None:
+        """
+        Eagerly materialize every statement DataFrame in extracted data.
+
+        Callers that need all DataFrames up front (e.g., before handing the
+        data to another thread) can use this; the conversions run on a
+        thread pool since they are mostly GIL-releasing numpy work.
+
+        Args:
+            statements_data (Dict[str, Any]): Output of extract_multi_year_statements
+        """
+        records = []
+        for statement_info in statements_data.values():
+            if statement_info['type'] == 'stitched':
+                records.append(statement_info['record'])
+            else:
+                records.extend(statement_info['statements'])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda record: record.dataframe, records))
+
+    def get_trend_analysis_data(self,
                               statement_type: str = 'IncomeStatement',
                               filing_type: str = "10-K",
-                              years: Optional[int] = None) -> pd.DataFrame:
+                              years: Optional[int] = None,
+                              merge_on: Optional[str] = None) -> pd.DataFrame:
         """
         Get financial data prepared for trend analysis.
-        
+
         Args:
             statement_type (str): Type of statement to analyze
             filing_type (str): Type of filing ("10-K" or "10-Q")
             years (int, optional): Number of years to analyze
-            
+            merge_on (str, optional): Column to merge per-filing frames on
+                (e.g., 'label'). When given, frames are combined column-wise
+                with pd.merge_ordered - which uses the time-series-friendly
+                code path - instead of stacked row-wise with concat. The
+                merge column must be unique within each filing's frame.
+
         Returns:
             pd.DataFrame: DataFrame optimized for trend analysis
         """
@@ -288,75 +721,174 @@ class FinancialStatementProcessor:
         statement_info = statements_data[statement_type]
         
         if statement_info['type'] == 'stitched':
-            df = statement_info['dataframe'].copy()
+            df = statement_info['record'].dataframe.copy()
             # Additional processing for trend analysis could be added here
             return df
+        elif merge_on is not None:
+            # Combine per-filing frames column-wise on the merge key,
+            # keeping one row per concept and one column set per filing
+            frames = []
+            seen_suffixes = set()
+            for record in statement_info['statements']:
+                df = record.dataframe
+                if merge_on not in df.columns:
+                    raise ValueError(f"Merge column '{merge_on}' not found in {statement_type} data")
+                if not df[merge_on].is_unique:
+                    # Catch duplicate keys early instead of letting the
+                    # outer merge blow up quadratically
+                    raise ValueError(f"Merge column '{merge_on}' is not unique "
+                                     f"in filing {record.accession_number}")
+                # Label each filing's value columns up front: every frame
+                # carries the same column names, so merging unrenamed frames
+                # hits pandas' duplicate-suffix error on the third merge and
+                # leaves the survivors as anonymous _x/_y columns
+                suffix = str(record.filing_date or record.accession_number)
+                if suffix in seen_suffixes:
+                    suffix = str(record.accession_number)
+                seen_suffixes.add(suffix)
+                df = df.rename(columns={col: f"{col}_{suffix}"
+                                        for col in df.columns if col != merge_on})
+                frames.append(df)
+
+            return reduce(
+                lambda left, right: pd.merge_ordered(left, right, on=merge_on, how='outer',
+                                                     fill_method='ffill'),
+                frames
+            )
         else:
             # Combine individual statements into a trend DataFrame
             combined_data = []
-            for stmt_data in statement_info['statements']:
-                df = stmt_data['dataframe'].copy()
-                df['filing_date'] = stmt_data['filing_date']
-                df['accession_number'] = stmt_data['accession_number']
+            for record in statement_info['statements']:
+                df = record.dataframe
+                # Metadata columns are constant per filing, so store them
+                # as categoricals rather than repeated Python objects.
+                # .assign returns a new frame sharing the original blocks,
+                # avoiding the full copy that .copy() + assignment forced
+                df = df.assign(
+                    filing_date=pd.Categorical([record.filing_date] * len(df)),
+                    accession_number=pd.Categorical([record.accession_number] * len(df))
+                )
                 combined_data.append(df)
+
+            return _concat_statement_frames(combined_data)
                 
-            if combined_data:
-                return pd.concat(combined_data, ignore_index=True)
+    # Frames above this row count are exported as newline-delimited JSON,
+    # written row by row instead of one giant string
+    _JSON_STREAM_THRESHOLD = 10_000
+
+    @staticmethod
+    def _write_json(df: pd.DataFrame, filepath: str) -> None:
+        """Write a DataFrame as JSON using orjson, streaming large frames as NDJSON."""
+        option = orjson.OPT_SERIALIZE_NUMPY
+        with open(filepath, 'wb') as f:
+            if len(df) > FinancialStatementProcessor._JSON_STREAM_THRESHOLD:
+                # One record per line, converted chunk by chunk so neither a
+                # whole-file string nor a full records list is materialized
+                step = FinancialStatementProcessor._JSON_STREAM_THRESHOLD
+                for start in range(0, len(df), step):
+                    for record in df.iloc[start:start + step].to_dict('records'):
+                        f.write(orjson.dumps(record, option=option, default=str))
+                        f.write(b'\n')
             else:
-                return pd.DataFrame()
-                
-    def export_to_csv(self, 
-                     output_dir: str = "exports",
-                     filing_type: str = "10-K",
-                     years: Optional[int] = None) -> Dict[str, str]:
+                f.write(orjson.dumps(df.to_dict('records'), option=option, default=str))
+
+    def export(self,
+               output_dir: str = "exports",
+               filing_type: str = "10-K",
+               years: Optional[int] = None,
+               file_format: str = 'csv') -> Dict[str, str]:
         """
-        Export all processed statements to CSV files.
-        
+        Export all processed statements to CSV, Parquet or JSON files.
+
+        JSON output uses orjson; frames larger than 10,000 rows are written
+        as newline-delimited JSON (one record per line) to avoid building
+        the whole document in memory.
+
         Args:
-            output_dir (str): Directory to save CSV files
+            output_dir (str): Directory to save exported files
             filing_type (str): Type of filing to export
             years (int, optional): Number of years to export
-            
+            file_format (str): Export format ('csv', 'parquet' or 'json')
+
         Returns:
             Dict[str, str]: Dictionary mapping statement types to file paths
         """
-        import os
-        
+        if file_format not in ('csv', 'parquet', 'json'):
+            raise ValueError("Unsupported file format. Use 'csv', 'parquet' or 'json'")
+
         statements_data = self.extract_multi_year_statements(filing_type, years, use_stitching=True)
-        
+
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
-        
+
         exported_files = {}
-        
-        for statement_type, statement_info in statements_data.items():
+
+        def _export_one(item):
+            statement_type, statement_info = item
             try:
                 if statement_info['type'] == 'stitched':
-                    df = statement_info['dataframe']
-                    filename = f"{self.company_ticker}_{statement_type}_{filing_type}_{years}years.csv"
+                    df = statement_info['record'].dataframe
+                    filename = f"{self.company_ticker}_{statement_type}_{filing_type}_{years}years.{file_format}"
                     filepath = os.path.join(output_dir, filename)
-                    df.to_csv(filepath, index=False)
-                    exported_files[statement_type] = filepath
-                    self.logger.info(f"Exported {statement_type} to {filepath}")
-                    
+                    if file_format == 'parquet':
+                        df.to_parquet(filepath, engine='pyarrow', compression='zstd')
+                    elif file_format == 'json':
+                        self._write_json(df, filepath)
+                    else:
+                        # chunksize streams the write instead of building
+                        # the whole CSV string in memory
+                        df.to_csv(filepath, index=False, chunksize=10_000)
+                    self.logger.info("Exported %s to %s", statement_type, filepath)
+                    return statement_type, filepath
+
             except Exception as e:
-                self.logger.error(f"Error exporting {statement_type}: {e}")
-                continue
-                
+                self.logger.error("Error exporting %s: %s", statement_type, e)
+            return None
+
+        # Disk writes release the GIL, so export statements in parallel
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for result in executor.map(_export_one, statements_data.items()):
+                if result is not None:
+                    exported_files[result[0]] = result[1]
+
         return exported_files
-        
+
+    def export_to_csv(self,
+                     output_dir: str = "exports",
+                     filing_type: str = "10-K",
+                     years: Optional[int] = None,
+                     file_format: str = 'csv') -> Dict[str, str]:
+        """Backwards-compatible alias for export()."""
+        return self.export(output_dir, filing_type, years, file_format)
+
+    # How long a cached summary stays fresh; __str__/repeated logging reuse it
+    _SUMMARY_TTL_SECONDS = 60
+
     def get_summary_info(self) -> Dict[str, Any]:
         """
         Get summary information about the processor and available data.
-        
+
+        The result is cached for a short TTL so that repeated access (e.g.,
+        printing the processor) does not trigger new EDGAR round-trips.
+
         Returns:
             Dict[str, Any]: Summary information
         """
+        cached = self._summary_cache
+        if cached is not None and time.monotonic() - cached[0] < self._SUMMARY_TTL_SECONDS:
+            return cached[1]
+
         try:
-            annual_filings = self.get_annual_filings()
-            quarterly_filings = self.get_quarterly_filings() if self.include_quarterly else []
-            
-            return {
+            # Annual and quarterly filings hit separate EDGAR endpoints,
+            # so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                annual_future = executor.submit(self.get_annual_filings)
+                quarterly_future = (executor.submit(self.get_quarterly_filings)
+                                    if self.include_quarterly else None)
+                annual_filings = annual_future.result()
+                quarterly_filings = quarterly_future.result() if quarterly_future is not None else []
+
+            summary = {
                 'company_ticker': self.company_ticker,
                 'company_name': self.company.name,
                 'max_years': self.max_years,
@@ -368,14 +900,18 @@ class FinancialStatementProcessor:
                 'latest_quarterly_filing': quarterly_filings[0].filing_date if len(quarterly_filings) > 0 else None,
                 'cached_statements': list(self.processed_statements.keys())
             }
+            self._summary_cache = (time.monotonic(), summary)
+            return summary
         except Exception as e:
-            self.logger.error(f"Error generating summary info: {e}")
+            self.logger.error("Error generating summary info: %s", e)
             return {'error': str(e)}
             
     def clear_cache(self):
         """Clear all cached data to free memory."""
         self.filings_cache.clear()
         self.processed_statements.clear()
+        self._xbrl_cache.clear()
+        self._summary_cache = None
         self.logger.info("Cache cleared")
         
     def __repr__(self) -> str:
@@ -10,14 +10,98 @@ Created: June 8, 2025
 
 from typing import List, Dict, Optional, Union, Tuple
 from datetime import datetime, timedelta, date
+import asyncio
+import functools
+import inspect
+import orjson
+import os
+import threading
+import time
 import pandas as pd
-from dataclasses import dataclass
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from pathlib import Path
 from edgar import Company, get_filings, set_identity
 from edgar.ownership import Ownership, Form4
 import warnings
 
 
-@dataclass
+class _RateLimiter:
+    """
+    Token-bucket throttle for SEC requests, shared across worker threads.
+
+    Refills at `rate` tokens per second up to `burst`; acquire() blocks until
+    a token is available, keeping aggregate request rate under the SEC cap
+    no matter how many workers are fetching.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 10):
+        self._rate = rate
+        self._capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity,
+                                   self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+# SEC tolerates ~10 requests/second; one shared limiter covers all monitors
+_SEC_RATE_LIMITER = _RateLimiter(rate=10.0)
+
+# Built once at import so str.contains doesn't rebuild the alternation for
+# every alert pass; word boundaries avoid matching e.g. "Directorate".
+# Kept as a pattern string (not re.compile) because Arrow-backed string
+# columns hand the pattern to pyarrow's regex kernel, which only accepts str.
+_C_SUITE_RE = r'\b(?:CEO|CFO|COO|CTO|President|Chairman|Director)\b'
+
+
+def _ttl_cache(ttl: int = 3600):
+    """
+    Memoize a monitor method on the instance with a time-to-live.
+
+    Results are stored in self._memo keyed by method name and arguments,
+    honoring self.cache_data as the global toggle. The default TTL matches
+    Form 4's T+2 cadence well enough for dashboard refreshes.
+    """
+    def decorator(method):
+        sig = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.cache_data:
+                return method(self, *args, **kwargs)
+
+            bound = sig.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (method.__name__,) + tuple(list(bound.arguments.items())[1:])
+
+            entry = self._memo.get(key)
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0]
+
+            result = method(self, *args, **kwargs)
+            self._memo[key] = (result, time.monotonic() + ttl)
+            return result
+        return wrapper
+    return decorator
+
+
+@dataclass(slots=True)
 class InsiderTransaction:
     """Data class representing a single insider transaction."""
     company_ticker: str
@@ -36,16 +120,78 @@ class InsiderTransaction:
     filing_url: str
 
 
-@dataclass
+class _TransactionBuffer:
+    """
+    Column-wise (structure-of-arrays) accumulator for insider transactions.
+
+    Extraction appends one value per column instead of allocating an
+    InsiderTransaction per row, and to_arrow() hands the parallel lists to
+    pyarrow in a single shot with no intermediate dicts. InsiderTransaction
+    stays around as the public per-row type.
+    """
+
+    _columns = tuple(f.name for f in fields(InsiderTransaction))
+    __slots__ = _columns
+
+    def __init__(self):
+        for name in self._columns:
+            setattr(self, name, [])
+
+    def __len__(self) -> int:
+        return len(self.company_ticker)
+
+    def append(self, **values) -> None:
+        """Append one transaction; expects exactly the InsiderTransaction fields."""
+        for name in self._columns:
+            getattr(self, name).append(values[name])
+
+    def extend(self, other: '_TransactionBuffer') -> None:
+        """Splice another buffer's columns onto this one."""
+        for name in self._columns:
+            getattr(self, name).extend(getattr(other, name))
+
+    def to_arrow(self) -> pa.Table:
+        """Materialize the buffered columns as an Arrow table."""
+        return pa.Table.from_pydict({name: getattr(self, name)
+                                     for name in self._columns})
+
+
+def _parse_ownership_xml(xml_content: str, ticker: str) -> '_TransactionBuffer':
+    """
+    Parse a filing's ownership XML into a transaction buffer.
+
+    Module-level so ProcessPoolExecutor can pickle it; workers receive raw
+    XML text rather than live filing objects, which carry HTTP state that
+    does not pickle.
+    """
+    ownership = Ownership.from_xml(xml_content)
+    return InsiderTradingMonitor._extract_transactions(ownership, ticker)
+
+
+@dataclass(slots=True)
 class InsiderAlert:
-    """Data class representing an insider trading alert."""
+    """
+    Data class representing an insider trading alert.
+
+    details holds a zero-copy DataFrame slice of the triggering rows (or a
+    dict wrapping one); call details_as_dict() to materialize plain dicts.
+    """
     alert_type: str
     company_ticker: str
     insider_name: str
     transaction_value: float
     threshold_exceeded: str
     alert_timestamp: datetime
-    details: Dict
+    details: Union[Dict, pd.DataFrame]
+
+    def details_as_dict(self) -> Dict:
+        """Materialize the alert details into plain dicts on demand."""
+        if isinstance(self.details, pd.DataFrame):
+            rows = self.details.to_dict('records')
+            return rows[0] if len(rows) == 1 else {'transactions': rows}
+        return {key: (value.to_dict('records') if isinstance(value, pd.DataFrame)
+                      else value)
+                for key, value in self.details.items()}
 
 
 class InsiderTradingMonitor:
@@ -67,40 +213,94 @@ class InsiderTradingMonitor:
     """
     
     def __init__(self, user_agent: str, companies: Optional[List[str]] = None,
-                 cache_data: bool = True):
+                 cache_data: bool = True,
+                 storage_path: Optional[Union[str, Path]] = None,
+                 cache_ttl_seconds: int = 3600):
         """
         Initialize the Insider Trading Monitor.
-        
+
         Args:
             user_agent (str): Email address for SEC identification
             companies (Optional[List[str]]): List of company tickers to monitor
             cache_data (bool): Whether to enable data caching
+            storage_path (Optional[Union[str, Path]]): Directory for a Parquet
+                store of fetched transactions, partitioned by ticker. When set,
+                fresh local data is used instead of re-fetching from SEC after
+                a process restart.
+            cache_ttl_seconds (int): How long cached fetches stay fresh
         """
         self.user_agent = user_agent
         self.companies = companies or []
         self.cache_data = cache_data
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.storage_path = Path(storage_path) if storage_path is not None else None
         self.data_cache = {}
+        # Assembled result DataFrames keyed by (companies, days_back, forms)
+        self._frame_cache = {}
+        # Ticker -> CIK lookups are stable; resolve each ticker once
+        self._cik_cache = {}
+        # Memoized analysis results - see _ttl_cache
+        self._memo = {}
         self.alert_thresholds = {
             'large_transaction': 1000000,  # $1M
             'unusual_volume': 0.05,  # 5% of shares outstanding
             'multiple_transactions': 3,  # 3+ transactions in a day
             'c_suite_threshold': 100000  # $100K for C-suite executives
         }
-        
+        # Created lazily on first parse; XML parsing is CPU-bound and the
+        # pool lets it scale past the GIL while downloads stay threaded.
+        # Creation is locked because company fetches run on worker threads.
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
+
         # Set SEC identity
         set_identity(user_agent)
-        
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Return the shared XML-parsing process pool, creating it on first use."""
+        if self._parse_pool is None:
+            # Double-checked under the lock: several fetch threads can race
+            # here, and each loser would otherwise leak a whole worker pool
+            with self._parse_pool_lock:
+                if self._parse_pool is None:
+                    self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._parse_pool
+
+    def close(self) -> None:
+        """Shut down the XML-parsing process pool, if one was created."""
+        with self._parse_pool_lock:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=True)
+                self._parse_pool = None
+
+    def __enter__(self) -> 'InsiderTradingMonitor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _invalidate_memo(self, method_names: Optional[Tuple[str, ...]] = None) -> None:
+        """Drop memoized results, optionally only for the given method names."""
+        if method_names is None:
+            self._memo.clear()
+            return
+        for key in [k for k in self._memo if k[0] in method_names]:
+            del self._memo[key]
+
     def add_company(self, ticker: str) -> None:
         """Add a company to the monitoring list."""
         if ticker not in self.companies:
             self.companies.append(ticker.upper())
-            
+            # The company list changes what ticker=None results contain
+            self._invalidate_memo()
+
     def remove_company(self, ticker: str) -> None:
         """Remove a company from the monitoring list."""
         ticker = ticker.upper()
         if ticker in self.companies:
             self.companies.remove(ticker)
-            
+            self._invalidate_memo()
+
     def set_alert_threshold(self, threshold_type: str, value: Union[int, float]) -> None:
         """
         Set alert thresholds for different types of insider activities.
@@ -112,167 +312,513 @@ class InsiderTradingMonitor:
         """
         if threshold_type in self.alert_thresholds:
             self.alert_thresholds[threshold_type] = value
+            # Only threshold-dependent results go stale
+            self._invalidate_memo(('generate_alerts', 'analyze_insider_patterns'))
         else:
             raise ValueError(f"Unknown threshold type: {threshold_type}")
     
-    def get_insider_filings(self, ticker: Optional[str] = None, 
+    def get_insider_filings(self, ticker: Optional[str] = None,
                            days_back: int = 30,
-                           form_types: Optional[List[str]] = None) -> pd.DataFrame:
+                           form_types: Optional[List[str]] = None,
+                           max_workers: int = 8) -> pd.DataFrame:
         """
         Retrieve insider filings for specified companies and time period.
-        
+
         Args:
             ticker (str): Specific company ticker (if None, uses all monitored companies)
             days_back (int): Number of days to look back
             form_types (List[str]): Form types to retrieve (default: ["3", "4", "5"])
-            
+            max_workers (int): Number of companies fetched concurrently (default: 8)
+
         Returns:
             pd.DataFrame: DataFrame containing insider filing information
         """
         if form_types is None:
             form_types = ["3", "4", "5"]
-            
+
         companies_to_check = [ticker.upper()] if ticker else self.companies
-        
+
         if not companies_to_check:
             raise ValueError("No companies specified for monitoring")
-        
-        all_transactions = []
-        
+
+        # Memoize the assembled frame so fully cache-hit calls skip even
+        # the concat (the analysis methods all funnel through here)
+        frame_key = (tuple(sorted(companies_to_check)), days_back, tuple(form_types))
+        if self.cache_data and frame_key in self._frame_cache:
+            cached_frame = self._frame_cache[frame_key]
+            if time.monotonic() - cached_frame['timestamp'] < self.cache_ttl_seconds:
+                return cached_frame['frame']
+
+        tables = []
+        uncached_companies = []
+
         for company_ticker in companies_to_check:
             cache_key = f"{company_ticker}_{days_back}_{'-'.join(form_types)}"
-            
+
             # Check cache first
             if self.cache_data and cache_key in self.data_cache:
                 cached_data = self.data_cache[cache_key]
-                if (datetime.now() - cached_data['timestamp']).seconds < 3600:  # 1 hour cache
-                    all_transactions.extend(cached_data['data'])
+                if time.monotonic() - cached_data['timestamp'] < self.cache_ttl_seconds:
+                    tables.append(cached_data['table'])
                     continue
+            uncached_companies.append(company_ticker)
 
+        if len(uncached_companies) > 1:
+            # One market-wide index query routed back to tickers by CIK
+            # beats a paginated per-company filing walk for each ticker
+            tables.extend(self._fetch_companies_batch(
+                uncached_companies, days_back, form_types, max_workers))
+        elif uncached_companies:
+            company_ticker = uncached_companies[0]
             try:
-                company = Company(company_ticker)
-                
-                # Get insider filings
-                filings = company.get_filings(form=form_types)
-                
-                # Filter by date
-                cutoff_date = datetime.now() - timedelta(days=days_back)
-                
-                # Convert cutoff_date to date for comparison
-                recent_filings = []
-                for f in filings:
-                    if hasattr(f, 'filing_date'):
-                        filing_date = f.filing_date
-                        # Convert filing_date to datetime if it's a date
-                        if isinstance(filing_date, date) and not isinstance(filing_date, datetime):
-                            filing_date = datetime.combine(filing_date, datetime.min.time())
-                        elif isinstance(filing_date, str):
-                            try:
-                                filing_date = datetime.strptime(filing_date, '%Y-%m-%d')
-                            except:
-                                continue
-                        
-                        if filing_date >= cutoff_date:
-                            recent_filings.append(f)
-                
-                company_transactions = []
-                
-                for filing in recent_filings:
-                    try:
-                        ownership = filing.obj()
-                        if isinstance(ownership, (Ownership, Form4)):
-                            transactions = self._extract_transactions(ownership, company_ticker)
-                            company_transactions.extend(transactions)
-                    except Exception as e:
-                        warnings.warn(f"Error processing filing {filing.accession_number}: {str(e)}")
-                        continue
-                
-                # Cache the results
-                if self.cache_data:
-                    self.data_cache[cache_key] = {
-                        'data': company_transactions,
-                        'timestamp': datetime.now()
-                    }
-                
-                all_transactions.extend(company_transactions)
-                
+                tables.append(self._fetch_company_transactions(
+                    company_ticker, days_back, form_types))
             except Exception as e:
                 warnings.warn(f"Error retrieving data for {company_ticker}: {str(e)}")
+
+        tables = [t for t in tables if t.num_rows > 0]
+        if not tables:
+            return pd.DataFrame()
+
+        # Zero-copy Arrow concat replaces rebuilding a dict per row
+        df = pa.concat_tables(tables, promote_options='default').to_pandas(
+            types_mapper=pd.ArrowDtype)
+
+        # Low-cardinality string columns become integer-coded categoricals,
+        # so groupbys and filters downstream compare codes, not strings.
+        # company_ticker is deliberately left out: analyze_insider_patterns
+        # aggregates it into per-insider lists, which neither categorical
+        # nor Arrow-backed string columns can hold
+        for col in ('transaction_code', 'ownership_type', 'security_title'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+
+        if self.cache_data:
+            self._frame_cache[frame_key] = {'frame': df, 'timestamp': time.monotonic()}
+
+        return df
+
+    def _fetch_company_transactions(self, company_ticker: str, days_back: int,
+                                    form_types: List[str]) -> pa.Table:
+        """
+        Fetch and extract insider transactions for a single company.
+
+        Runs on a worker thread from get_insider_filings; every call that
+        triggers an SEC request first takes a token from the shared limiter.
+
+        Args:
+            company_ticker (str): Company ticker
+            days_back (int): Number of days to look back
+            form_types (List[str]): Form types to retrieve
+
+        Returns:
+            pa.Table: Extracted transactions as an Arrow table
+        """
+        cache_key = f"{company_ticker}_{days_back}_{'-'.join(form_types)}"
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+
+        # Prefer fresh local data over a full SEC round-trip (cold starts)
+        stored = self._load_from_storage(company_ticker, cutoff_date)
+        if stored is not None:
+            if self.cache_data:
+                self.data_cache[cache_key] = {'table': stored, 'timestamp': time.monotonic()}
+            return stored
+
+        _SEC_RATE_LIMITER.acquire()
+        company = Company(company_ticker)
+
+        # Get insider filings
+        _SEC_RATE_LIMITER.acquire()
+        filings = company.get_filings(form=form_types)
+
+        # Filter by date in one vectorized pass instead of per-filing
+        # isinstance/strptime chains; unparseable dates coerce to NaT
+        filings_list = list(filings)
+        raw_dates = [getattr(f, 'filing_date', None) for f in filings_list]
+        parsed_dates = pd.to_datetime(pd.Series(raw_dates, dtype='object'),
+                                      errors='coerce', format='mixed')
+        cutoff = pd.Timestamp(cutoff_date)
+        recent_filings = [f for f, d in zip(filings_list, parsed_dates)
+                          if pd.notna(d) and d >= cutoff]
+
+        return self._build_company_table(company_ticker, recent_filings, cache_key)
+
+    def _build_company_table(self, company_ticker: str, recent_filings: List,
+                             cache_key: str) -> pa.Table:
+        """
+        Process a ticker's recent filings into a cached Arrow table.
+
+        Args:
+            company_ticker (str): Company ticker
+            recent_filings (List): Filings already filtered to the window
+            cache_key (str): Key under which to cache the result
+
+        Returns:
+            pa.Table: Extracted transactions as an Arrow table
+        """
+        # Each filing.obj() is an independent SEC fetch; fan them out
+        # concurrently instead of serializing a hot ticker's Form 4 backlog
+        buffer = asyncio.run(self._collect_filings_async(recent_filings, company_ticker))
+        table = buffer.to_arrow()
+
+        # Cache the results
+        if self.cache_data:
+            self.data_cache[cache_key] = {
+                'table': table,
+                'timestamp': time.monotonic()
+            }
+        self._append_to_storage(table)
+
+        return table
+
+    def _resolve_cik(self, company_ticker: str) -> int:
+        """Look up a ticker's CIK, caching it for the life of the monitor."""
+        cik = self._cik_cache.get(company_ticker)
+        if cik is None:
+            _SEC_RATE_LIMITER.acquire()
+            cik = Company(company_ticker).cik
+            self._cik_cache[company_ticker] = cik
+        return cik
+
+    def _fetch_companies_batch(self, tickers: List[str], days_back: int,
+                               form_types: List[str],
+                               max_workers: int = 8) -> List[pa.Table]:
+        """
+        Fetch several companies' transactions with one market-wide query.
+
+        A single get_filings call over the date window replaces a paginated
+        per-company filing walk for every ticker; the results are routed
+        back to their tickers by CIK. Storage-fresh tickers are served
+        locally and skip the index query entirely. Per-ticker cache keys
+        are the same ones _fetch_company_transactions writes.
+
+        Args:
+            tickers (List[str]): Company tickers to fetch
+            days_back (int): Number of days to look back
+            form_types (List[str]): Form types to retrieve
+            max_workers (int): Number of tickers processed concurrently
+
+        Returns:
+            List[pa.Table]: One table per successfully fetched ticker
+        """
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        tables = []
+        to_fetch = []
+
+        for company_ticker in tickers:
+            cache_key = f"{company_ticker}_{days_back}_{'-'.join(form_types)}"
+            stored = self._load_from_storage(company_ticker, cutoff_date)
+            if stored is not None:
+                if self.cache_data:
+                    self.data_cache[cache_key] = {'table': stored, 'timestamp': time.monotonic()}
+                tables.append(stored)
                 continue
-        return pd.DataFrame([t.__dict__ for t in all_transactions])
-    
-    def _extract_transactions(self, ownership: Ownership, ticker: str) -> List[InsiderTransaction]:
+            to_fetch.append(company_ticker)
+
+        if not to_fetch:
+            return tables
+
+        ticker_by_cik = {}
+        for company_ticker in to_fetch:
+            try:
+                ticker_by_cik[self._resolve_cik(company_ticker)] = company_ticker
+            except Exception as e:
+                warnings.warn(f"Could not resolve CIK for {company_ticker}: {str(e)}")
+
+        try:
+            _SEC_RATE_LIMITER.acquire()
+            window = f"{cutoff_date:%Y-%m-%d}:{datetime.now():%Y-%m-%d}"
+            market_filings = get_filings(form=form_types, filing_date=window)
+        except Exception as e:
+            # Degrade to per-company walks instead of failing the whole call
+            warnings.warn(f"Market-wide filing query failed, "
+                          f"falling back to per-company fetches: {str(e)}")
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    pool.submit(self._fetch_company_transactions, t, days_back, form_types): t
+                    for t in to_fetch
+                }
+                for future in as_completed(futures):
+                    company_ticker = futures[future]
+                    try:
+                        tables.append(future.result())
+                    except Exception as fetch_error:
+                        warnings.warn(f"Error retrieving data for {company_ticker}: "
+                                      f"{str(fetch_error)}")
+            return tables
+
+        # Route only tickers whose CIK resolved; a failed lookup must not
+        # end up caching an empty table under that ticker's key
+        filings_by_ticker = {t: [] for t in ticker_by_cik.values()}
+        if market_filings is not None:
+            matched = market_filings.filter(cik=list(ticker_by_cik))
+            for filing in matched:
+                company_ticker = ticker_by_cik.get(filing.cik)
+                if company_ticker is not None:
+                    filings_by_ticker[company_ticker].append(filing)
+
+        # Per-ticker processing is still independent and I/O-bound, so keep
+        # it parallel; the shared rate limiter keeps SEC traffic legal
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(
+                    self._build_company_table, company_ticker, recent_filings,
+                    f"{company_ticker}_{days_back}_{'-'.join(form_types)}"
+                ): company_ticker
+                for company_ticker, recent_filings in filings_by_ticker.items()
+            }
+            for future in as_completed(futures):
+                company_ticker = futures[future]
+                try:
+                    tables.append(future.result())
+                except Exception as e:
+                    warnings.warn(f"Error retrieving data for {company_ticker}: {str(e)}")
+
+        return tables
+
+    # Local store entries older than this are considered stale and re-fetched
+    _STORAGE_TTL_SECONDS = 3600
+
+    def _load_from_storage(self, company_ticker: str, cutoff_date: datetime) -> Optional[pa.Table]:
+        """
+        Load a ticker's recent transactions from the local Parquet store.
+
+        Returns None when no store is configured, the ticker's partition is
+        missing, or the partition is older than the storage TTL (so newly
+        filed forms are eventually picked up).
+
+        Args:
+            company_ticker (str): Company ticker
+            cutoff_date (datetime): Earliest filing date of interest
+
+        Returns:
+            pa.Table or None: Stored transactions on or after cutoff_date
+        """
+        if self.storage_path is None:
+            return None
+
+        partition = self.storage_path / f"company_ticker={company_ticker}"
+        if not partition.exists():
+            return None
+
+        newest = max((f.stat().st_mtime for f in partition.glob("*.parquet")), default=0)
+        if datetime.now().timestamp() - newest > self._STORAGE_TTL_SECONDS:
+            return None
+
+        try:
+            table = pq.read_table(
+                str(self.storage_path),
+                filters=[('company_ticker', '=', company_ticker),
+                         ('filing_date', '>=', cutoff_date)]
+            )
+        except Exception as e:
+            warnings.warn(f"Could not read local store for {company_ticker}: {str(e)}")
+            return None
+
+        # The store is append-only, so overlapping fetch windows can leave
+        # duplicate rows; drop them on the way out
+        df = table.to_pandas().drop_duplicates()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        # The partition column round-trips as dictionary<string>; cast it
+        # back to plain string so concat with freshly fetched tables works
+        index = table.schema.get_field_index('company_ticker')
+        if index != -1 and pa.types.is_dictionary(table.schema.field(index).type):
+            table = table.set_column(
+                index, pa.field('company_ticker', pa.string()),
+                table.column(index).cast(pa.string()))
+        return table
+
+    def _append_to_storage(self, table: pa.Table) -> None:
+        """Append fetched transactions to the local Parquet store, if configured."""
+        if self.storage_path is None or table.num_rows == 0:
+            return
+        try:
+            pq.write_to_dataset(table, root_path=str(self.storage_path),
+                                partition_cols=['company_ticker'])
+        except Exception as e:
+            warnings.warn(f"Could not persist transactions to {self.storage_path}: {str(e)}")
+
+    # Cap on in-flight filing.obj() fetches within one company's fan-out
+    _MAX_CONCURRENT_FILINGS = 10
+
+    def _fetch_ownership(self, filing):
+        """Fetch a filing's ownership object, taking a rate-limit token first."""
+        _SEC_RATE_LIMITER.acquire()
+        return filing.obj()
+
+    def _fetch_ownership_xml(self, filing) -> Optional[str]:
+        """Fetch a filing's raw ownership XML, taking a rate-limit token first."""
+        _SEC_RATE_LIMITER.acquire()
+        return filing.xml()
+
+    async def _process_filing_async(self, filing, ticker: str,
+                                    semaphore: asyncio.Semaphore) -> _TransactionBuffer:
+        """
+        Fetch one filing's ownership XML and parse it into transactions.
+
+        Only the download is held under the semaphore; parsing is CPU-bound
+        and runs in the process pool, so worker processes can chew through
+        XML while further downloads proceed.
+
+        Args:
+            filing: Filing object
+            ticker (str): Company ticker
+            semaphore (asyncio.Semaphore): Caps in-flight SEC fetches
+
+        Returns:
+            _TransactionBuffer: Extracted transaction columns (possibly empty)
+        """
+        async with semaphore:
+            # filing.xml() is synchronous, so run it on a worker thread
+            xml_content = await asyncio.to_thread(self._fetch_ownership_xml, filing)
+
+        if xml_content:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_parse_pool(), _parse_ownership_xml, xml_content, ticker)
+
+        # Rare filings without an ownership XML document: fall back to the
+        # in-process object path
+        ownership = await asyncio.to_thread(self._fetch_ownership, filing)
+        if isinstance(ownership, (Ownership, Form4)):
+            return self._extract_transactions(ownership, ticker)
+        return _TransactionBuffer()
+
+    async def _collect_filings_async(self, filings, ticker: str) -> _TransactionBuffer:
+        """
+        Concurrently process a company's recent filings into one buffer.
+
+        Results are folded in as each filing completes, so the buffer fills
+        while later downloads and parses are still in flight instead of
+        waiting for the whole batch; failures are warned about per filing.
+
+        Returns:
+            _TransactionBuffer: All extracted transactions for the company
+        """
+        # asyncio.Semaphore is bound to the running loop, so create it here
+        # rather than at module scope; the cross-thread SEC budget is
+        # enforced by the shared token-bucket limiter
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_FILINGS)
+        buffer = _TransactionBuffer()
+
+        async def process(filing):
+            try:
+                return await self._process_filing_async(filing, ticker, semaphore)
+            except Exception as e:
+                warnings.warn(f"Error processing filing {filing.accession_number}: {str(e)}")
+                return _TransactionBuffer()
+
+        for task in asyncio.as_completed([process(f) for f in filings]):
+            buffer.extend(await task)
+        return buffer
+
+    @staticmethod
+    def _extract_transactions(ownership: Ownership, ticker: str) -> _TransactionBuffer:
         """
         Extract transaction details from ownership filing using edgartools to_dataframe() method.
-        
+
         Args:
             ownership: Ownership object from edgar
             ticker (str): Company ticker
-            
+
         Returns:
-            List[InsiderTransaction]: List of transaction objects
+            _TransactionBuffer: Column-wise buffer of extracted transactions
         """
-        transactions = []
-        
+        buffer = _TransactionBuffer()
+
         try:
             # Use the edgartools to_dataframe() method to get structured transaction data
             if hasattr(ownership, 'to_dataframe'):
                 df = ownership.to_dataframe()
                 
                 if not df.empty:
-                    # Get basic filing information
-                    filing_date = getattr(ownership, 'reporting_period', datetime.now().date())
-                    if isinstance(filing_date, date) and not isinstance(filing_date, datetime):
+                    # Get basic filing information. reporting_period is an
+                    # ISO string; normalize it (and plain dates) to datetime
+                    # so the filing_date column is a real timestamp and the
+                    # Parquet store's date filter has a matching type
+                    filing_date = getattr(ownership, 'reporting_period', None)
+                    if isinstance(filing_date, str):
+                        parsed = pd.to_datetime(filing_date, errors='coerce')
+                        filing_date = parsed.to_pydatetime() if pd.notna(parsed) else None
+                    elif isinstance(filing_date, date) and not isinstance(filing_date, datetime):
                         filing_date = datetime.combine(filing_date, datetime.min.time())
+                    if filing_date is None:
+                        filing_date = datetime.combine(date.today(), datetime.min.time())
                     
-                    # Process each transaction in the dataframe
-                    for _, row in df.iterrows():
-                        # Parse transaction date
-                        transaction_date = row.get('Date', filing_date)
-                        if isinstance(transaction_date, str):
-                            try:
-                                transaction_date = pd.to_datetime(transaction_date).to_pydatetime()
-                            except:
-                                transaction_date = filing_date
-                        elif isinstance(transaction_date, date) and not isinstance(transaction_date, datetime):
-                            transaction_date = datetime.combine(transaction_date, datetime.min.time())
-                        
-                        # Extract transaction details
-                        shares = float(row.get('Shares', 0) or 0)
-                        price = float(row.get('Price', 0) or 0)
-                        transaction_value = float(row.get('Value', 0) or 0)
-                        
+                    # Normalize all transaction dates in one vectorized pass;
+                    # unparseable values coerce to NaT and fall back to filing_date
+                    if 'Date' in df.columns:
+                        parsed = pd.to_datetime(df['Date'], errors='coerce', format='mixed')
+                        transaction_dates = [
+                            d.to_pydatetime() if pd.notna(d) else filing_date
+                            for d in parsed
+                        ]
+                    else:
+                        transaction_dates = [filing_date] * len(df)
+
+                    # Pull each needed column out once as a plain list; the
+                    # old per-row row.get() calls went through the Series
+                    # descriptor protocol for every field of every row
+                    def column(name, default):
+                        return df[name].tolist() if name in df.columns else [default] * len(df)
+
+                    issuers = column('Issuer', ticker)
+                    insiders = column('Insider', 'Unknown')
+                    positions = column('Position', 'Unknown')
+                    codes = column('Code', 'Unknown')
+                    descriptions = column('Description', 'Common Stock')
+                    shares_col = column('Shares', 0)
+                    prices = column('Price', 0)
+                    values = column('Value', 0)
+                    remaining = column('Remaining Shares', 0)
+
+                    # The issuer CIK is a property of the filing, not the row;
+                    # resolve it and the filing URL once instead of running
+                    # the hasattr chain for every transaction
+                    issuer_obj = getattr(ownership, 'issuer', None)
+                    cik = getattr(issuer_obj, 'cik', "") if issuer_obj is not None else ""
+                    filing_url = (f"https://www.sec.gov/Archives/edgar/data/{cik}/" if cik
+                                  else f"https://www.sec.gov/edgar/search/#/q={ticker}")
+
+                    # Process each transaction row
+                    for (transaction_date, issuer, insider, position, code,
+                         description, raw_shares, raw_price, raw_value,
+                         raw_remaining) in zip(transaction_dates, issuers,
+                                               insiders, positions, codes,
+                                               descriptions, shares_col,
+                                               prices, values, remaining):
+                        shares = float(raw_shares or 0)
+                        price = float(raw_price or 0)
+                        transaction_value = float(raw_value or 0)
+
                         # If value is not available, calculate it
                         if transaction_value == 0 and shares > 0 and price > 0:
                             transaction_value = shares * price
-                          # Get CIK for filing URL
-                        cik = ""
-                        if hasattr(ownership, 'issuer') and hasattr(ownership.issuer, 'cik'):
-                            cik = ownership.issuer.cik
-                        
-                        trans = InsiderTransaction(
+
+                        buffer.append(
                             company_ticker=ticker,
-                            company_name=row.get('Issuer', ticker),
+                            company_name=issuer,
                             filing_date=filing_date,
                             transaction_date=transaction_date,
-                            insider_name=row.get('Insider', 'Unknown'),
-                            insider_title=row.get('Position', 'Unknown'),
-                            transaction_code=row.get('Code', 'Unknown'),
-                            security_title=row.get('Description', 'Common Stock'),
+                            insider_name=insider,
+                            insider_title=position,
+                            transaction_code=code,
+                            security_title=description,
                             shares=shares,
                             price_per_share=price,
                             transaction_value=transaction_value,
                             ownership_type='Direct',  # Default, as this info isn't in the dataframe
-                            shares_owned_after=float(row.get('Remaining Shares', 0) or 0),
-                            filing_url=f"https://www.sec.gov/Archives/edgar/data/{cik}/" if cik else f"https://www.sec.gov/edgar/search/#/q={ticker}"
+                            shares_owned_after=float(raw_remaining or 0),
+                            filing_url=filing_url
                         )
-                        transactions.append(trans)
-                        
+
         except Exception as e:
             warnings.warn(f"Error extracting transaction details: {str(e)}")
-            
-        return transactions
+
+        return buffer
     
+    @_ttl_cache(ttl=3600)
     def analyze_insider_patterns(self, ticker: Optional[str] = None, 
                                days_back: int = 90) -> Dict:
         """
@@ -301,7 +847,7 @@ class InsiderTradingMonitor:
                     "end": df['filing_date'].max()
                 }
             },
-            "by_transaction_type": df.groupby('transaction_code').agg({
+            "by_transaction_type": df.groupby('transaction_code', observed=True).agg({
                 'shares': 'sum',
                 'transaction_value': 'sum',
                 'insider_name': 'count'
@@ -309,18 +855,25 @@ class InsiderTradingMonitor:
             "by_company": df.groupby('company_ticker').agg({
                 'transaction_value': ['sum', 'mean', 'count']
             }).to_dict(),
-            "by_insider": df.groupby('insider_name').agg({
+            # The ticker-list agg runs on a plain-object view: Arrow-backed
+            # string columns cannot hold the list-per-group result
+            "by_insider": df.assign(
+                company_ticker=df['company_ticker'].astype(object)
+            ).groupby('insider_name').agg({
                 'transaction_value': ['sum', 'mean', 'count'],
                 'company_ticker': lambda x: list(set(x))
             }).to_dict(),
+            # DataFrame slices rather than records - materializing dicts here
+            # would copy every row; callers can .to_dict('records') if needed
             "large_transactions": df[
                 df['transaction_value'] > self.alert_thresholds['large_transaction']
-            ].to_dict('records'),
-            "recent_activity": df.sort_values('filing_date', ascending=False).head(10).to_dict('records')
+            ],
+            "recent_activity": df.sort_values('filing_date', ascending=False).head(10)
         }
         
         return analysis
     
+    @_ttl_cache(ttl=3600)
     def generate_alerts(self, ticker: Optional[str] = None, 
                        days_back: int = 7) -> List[InsiderAlert]:
         """
@@ -339,103 +892,200 @@ class InsiderTradingMonitor:
         if df.empty:
             return alerts
         
-        # Large transaction alerts
+        # Large transaction alerts; itertuples avoids the per-row Series
+        # that iterrows materializes
         large_transactions = df[df['transaction_value'] > self.alert_thresholds['large_transaction']]
-        for _, transaction in large_transactions.iterrows():
-            alert = InsiderAlert(
+        large_threshold = f"${self.alert_thresholds['large_transaction']:,.0f}"
+        for position, row in enumerate(large_transactions.itertuples(index=False)):
+            alerts.append(InsiderAlert(
                 alert_type="large_transaction",
-                company_ticker=transaction['company_ticker'],
-                insider_name=transaction['insider_name'],
-                transaction_value=transaction['transaction_value'],
-                threshold_exceeded=f"${self.alert_thresholds['large_transaction']:,.0f}",
+                company_ticker=row.company_ticker,
+                insider_name=row.insider_name,
+                transaction_value=row.transaction_value,
+                threshold_exceeded=large_threshold,
                 alert_timestamp=datetime.now(),
-                details=transaction.to_dict()
-            )
-            alerts.append(alert)
-        
+                details=large_transactions.iloc[[position]]
+            ))
+
         # C-suite executive alerts (lower threshold)
-        c_suite_keywords = ['CEO', 'CFO', 'COO', 'CTO', 'President', 'Chairman', 'Director']
         c_suite_transactions = df[
-            (df['insider_title'].str.contains('|'.join(c_suite_keywords), case=False, na=False)) &
+            (df['insider_title'].str.contains(_C_SUITE_RE, case=False, na=False)) &
             (df['transaction_value'] > self.alert_thresholds['c_suite_threshold'])
         ]
-        
-        for _, transaction in c_suite_transactions.iterrows():
-            alert = InsiderAlert(
+        c_suite_threshold = f"C-Suite ${self.alert_thresholds['c_suite_threshold']:,.0f}"
+        for position, row in enumerate(c_suite_transactions.itertuples(index=False)):
+            alerts.append(InsiderAlert(
                 alert_type="c_suite_transaction",
-                company_ticker=transaction['company_ticker'],
-                insider_name=transaction['insider_name'],
-                transaction_value=transaction['transaction_value'],
-                threshold_exceeded=f"C-Suite ${self.alert_thresholds['c_suite_threshold']:,.0f}",
+                company_ticker=row.company_ticker,
+                insider_name=row.insider_name,
+                transaction_value=row.transaction_value,
+                threshold_exceeded=c_suite_threshold,
                 alert_timestamp=datetime.now(),
-                details=transaction.to_dict()
-            )
-            alerts.append(alert)
-        
-        # Multiple transactions by same insider
-        insider_counts = df.groupby(['insider_name', 'company_ticker']).size()
-        multiple_transactions = insider_counts[
-            insider_counts >= self.alert_thresholds['multiple_transactions']
+                details=c_suite_transactions.iloc[[position]]
+            ))
+
+        # Multiple transactions by same insider - count and total in one agg
+        grouped = df.groupby(['insider_name', 'company_ticker'])
+        per_insider = grouped.agg(
+            transaction_count=('transaction_value', 'size'),
+            total_value=('transaction_value', 'sum')
+        )
+        qualifying = per_insider[
+            per_insider['transaction_count'] >= self.alert_thresholds['multiple_transactions']
         ]
-        
-        for (insider, company), count in multiple_transactions.items():
-            insider_data = df[(df['insider_name'] == insider) & (df['company_ticker'] == company)]
-            total_value = insider_data['transaction_value'].sum()
-            
-            alert = InsiderAlert(
+
+        # Collect the qualifying groups' rows from the existing grouping in a
+        # single pass, instead of re-scanning df with a boolean mask for every
+        # (insider, company) pair
+        qualifying_keys = set(qualifying.index)
+        group_frames = {key: group
+                        for key, group in grouped if key in qualifying_keys}
+
+        for row in qualifying.reset_index().itertuples(index=False):
+            alerts.append(InsiderAlert(
                 alert_type="multiple_transactions",
-                company_ticker=company,
-                insider_name=insider,
-                transaction_value=total_value,
-                threshold_exceeded=f"{count} transactions",
+                company_ticker=row.company_ticker,
+                insider_name=row.insider_name,
+                transaction_value=row.total_value,
+                threshold_exceeded=f"{row.transaction_count} transactions",
                 alert_timestamp=datetime.now(),
                 details={
-                    "transaction_count": count,
-                    "total_value": total_value,
-                    "transactions": insider_data.to_dict('records')
+                    "transaction_count": row.transaction_count,
+                    "total_value": row.total_value,
+                    "transactions": group_frames[(row.insider_name, row.company_ticker)]
                 }
-            )
-            alerts.append(alert)
-        
+            ))
+
         return alerts
     
-    def export_data(self, ticker: Optional[str] = None, 
+    # Formats whose writers accept incremental batches
+    _STREAMING_FORMATS = ('csv', 'parquet')
+
+    # Frames larger than this are exported as newline-delimited JSON
+    _JSON_STREAM_THRESHOLD = 10_000
+
+    @staticmethod
+    def _write_json(df: pd.DataFrame, filepath: str) -> None:
+        """Write a DataFrame as JSON using orjson, streaming large frames as NDJSON."""
+        option = orjson.OPT_SERIALIZE_NUMPY
+        with open(filepath, 'wb') as f:
+            if len(df) > InsiderTradingMonitor._JSON_STREAM_THRESHOLD:
+                # One record per line, converted chunk by chunk so neither a
+                # whole-file string nor a full records list is materialized
+                step = InsiderTradingMonitor._JSON_STREAM_THRESHOLD
+                for start in range(0, len(df), step):
+                    for record in df.iloc[start:start + step].to_dict('records'):
+                        f.write(orjson.dumps(record, option=option, default=str))
+                        f.write(b'\n')
+            else:
+                f.write(orjson.dumps(df.to_dict('records'), option=option, default=str))
+
+    def export_data(self, ticker: Optional[str] = None,
                    days_back: int = 30,
                    file_format: str = 'csv',
                    filename: Optional[str] = None) -> str:
         """
         Export insider trading data to file.
-        
+
+        csv and parquet exports stream one company's table at a time, so
+        peak memory stays at a single company's transactions instead of the
+        whole pull; excel buffers the full frame (xlsx writers need the
+        complete sheet in memory). JSON uses orjson; frames larger than
+        10,000 rows are written as newline-delimited JSON, one record per
+        line, instead of a single records array.
+
         Args:
             ticker (str): Specific company ticker (if None, exports all monitored companies)
             days_back (int): Number of days of data to export
-            file_format (str): Export format ('csv', 'excel', 'json')
+            file_format (str): Export format ('csv', 'excel', 'json', 'parquet')
             filename (str): Custom filename (if None, generates timestamp-based name)
-            
+
         Returns:
             str: Path to exported file
         """
-        df = self.get_insider_filings(ticker, days_back)
-        
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             company_suffix = f"_{ticker}" if ticker else "_all_companies"
             filename = f"insider_trading_{timestamp}{company_suffix}"
-        
-        if file_format.lower() == 'csv':
-            filepath = f"{filename}.csv"
-            df.to_csv(filepath, index=False)
-        elif file_format.lower() == 'excel':
+
+        fmt = file_format.lower()
+        if fmt in self._STREAMING_FORMATS:
+            return self._stream_export(ticker, days_back, fmt, filename)
+
+        df = self.get_insider_filings(ticker, days_back)
+        if fmt == 'excel':
             filepath = f"{filename}.xlsx"
             df.to_excel(filepath, index=False)
-        elif file_format.lower() == 'json':
+        elif fmt == 'json':
             filepath = f"{filename}.json"
-            df.to_json(filepath, orient='records', date_format='iso')
+            self._write_json(df, filepath)
         else:
-            raise ValueError("Unsupported file format. Use 'csv', 'excel', or 'json'")
-        
+            raise ValueError("Unsupported file format. Use 'csv', 'excel', 'json', or 'parquet'")
+
+        return filepath
+
+    def _stream_export(self, ticker: Optional[str], days_back: int,
+                       fmt: str, filename: str) -> str:
+        """
+        Write one company's transactions at a time to the target file.
+
+        Cached tables are reused; only uncached companies hit SEC. The
+        writer is opened on the first non-empty table and every later table
+        is cast to that schema.
+
+        Args:
+            ticker (str): Specific company ticker (if None, exports all monitored companies)
+            days_back (int): Number of days of data to export
+            fmt (str): One of _STREAMING_FORMATS
+            filename (str): Output filename without extension
+
+        Returns:
+            str: Path to exported file
+        """
+        companies_to_check = [ticker.upper()] if ticker else self.companies
+        if not companies_to_check:
+            raise ValueError("No companies specified for monitoring")
+
+        form_types = ["3", "4", "5"]
+        filepath = f"{filename}.{fmt}"
+        writer = None
+        schema = None
+        try:
+            for company_ticker in companies_to_check:
+                cache_key = f"{company_ticker}_{days_back}_{'-'.join(form_types)}"
+                cached = self.data_cache.get(cache_key) if self.cache_data else None
+                if cached and time.monotonic() - cached['timestamp'] < self.cache_ttl_seconds:
+                    table = cached['table']
+                else:
+                    try:
+                        table = self._fetch_company_transactions(
+                            company_ticker, days_back, form_types)
+                    except Exception as e:
+                        warnings.warn(f"Error retrieving data for {company_ticker}: {str(e)}")
+                        continue
+                if table.num_rows == 0:
+                    continue
+                if writer is None:
+                    schema = table.schema
+                    if fmt == 'parquet':
+                        writer = pq.ParquetWriter(filepath, schema)
+                    else:
+                        writer = pacsv.CSVWriter(filepath, schema)
+                writer.write_table(table.select(schema.names).cast(schema))
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            # Nothing matched; still emit a valid (empty) file for the caller
+            if fmt == 'parquet':
+                pq.write_table(pa.table({}), filepath)
+            else:
+                pd.DataFrame().to_csv(filepath, index=False)
+
         return filepath
     
+    @_ttl_cache(ttl=3600)
     def get_summary_statistics(self, ticker: Optional[str] = None, 
                              days_back: int = 30) -> Dict:
         """
@@ -471,7 +1121,10 @@ class InsiderTradingMonitor:
                 "mean": df['shares'].mean(),
                 "median": df['shares'].median()
             },
-            "transaction_codes": df['transaction_code'].value_counts().to_dict(),
+            # Grouped with observed=True so codes the period never saw
+            # don't show up as zero counts
+            "transaction_codes": df.groupby('transaction_code', observed=True)
+                                   .size().sort_values(ascending=False).to_dict(),
             "most_active_insiders": df['insider_name'].value_counts().head(10).to_dict(),
             "most_active_companies": df['company_ticker'].value_counts().head(10).to_dict()
         }
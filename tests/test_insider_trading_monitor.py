@@ -0,0 +1,113 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pyarrow as pa
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "Dashboard" / "classes"))
+
+from insider_trading_monitor import InsiderTradingMonitor, _TransactionBuffer
+
+
+def test_storage_round_trip(tmp_path):
+    monitor = InsiderTradingMonitor(
+        user_agent="test@example.com",
+        companies=["AAPL"],
+        storage_path=tmp_path / "store",
+    )
+
+    buffer = _TransactionBuffer()
+    filing_date = datetime(2025, 6, 1)
+    buffer.append(
+        company_ticker="AAPL",
+        company_name="Apple Inc.",
+        filing_date=filing_date,
+        transaction_date=filing_date,
+        insider_name="Jane Doe",
+        insider_title="CEO",
+        transaction_code="P",
+        security_title="Common Stock",
+        shares=100.0,
+        price_per_share=10.0,
+        transaction_value=1000.0,
+        ownership_type="Direct",
+        shares_owned_after=500.0,
+        filing_url="https://www.sec.gov/Archives/edgar/data/320193/",
+    )
+    monitor._append_to_storage(buffer.to_arrow())
+
+    table = monitor._load_from_storage("AAPL", filing_date - timedelta(days=30))
+    assert table is not None
+    assert table.num_rows == 1
+    assert table.to_pandas()['insider_name'].iloc[0] == "Jane Doe"
+
+    # Stored tables must concat with freshly fetched ones: the partition
+    # column round-trips dictionary-encoded and is cast back to string
+    fresh = _TransactionBuffer()
+    fresh.append(
+        company_ticker="MSFT",
+        company_name="Microsoft Corp.",
+        filing_date=filing_date,
+        transaction_date=filing_date,
+        insider_name="John Roe",
+        insider_title="CFO",
+        transaction_code="S",
+        security_title="Common Stock",
+        shares=50.0,
+        price_per_share=20.0,
+        transaction_value=1000.0,
+        ownership_type="Direct",
+        shares_owned_after=100.0,
+        filing_url="https://www.sec.gov/Archives/edgar/data/789019/",
+    )
+    combined = pa.concat_tables([table, fresh.to_arrow()],
+                                promote_options='default')
+    assert combined.num_rows == 2
+
+    # Entries before the cutoff are filtered out on read
+    table = monitor._load_from_storage("AAPL", filing_date + timedelta(days=1))
+    assert table is None or table.num_rows == 0
+
+
+def _transaction_table(ticker):
+    buffer = _TransactionBuffer()
+    filing_date = datetime(2025, 6, 1)
+    buffer.append(
+        company_ticker=ticker,
+        company_name=f"{ticker} Inc.",
+        filing_date=filing_date,
+        transaction_date=filing_date,
+        insider_name="Jane Doe",
+        insider_title="CEO",
+        transaction_code="P",
+        security_title="Common Stock",
+        shares=100.0,
+        price_per_share=10.0,
+        transaction_value=1000.0,
+        ownership_type="Direct",
+        shares_owned_after=500.0,
+        filing_url=f"https://www.sec.gov/edgar/search/#/q={ticker}",
+    )
+    return buffer.to_arrow()
+
+
+def test_analyze_insider_patterns_on_arrow_backed_frame(monkeypatch):
+    # Regression: the by_insider ticker-list agg must work on the
+    # Arrow-backed frame that get_insider_filings assembles
+    monitor = InsiderTradingMonitor(
+        user_agent="test@example.com",
+        companies=["AAPL", "MSFT"],
+    )
+    monkeypatch.setattr(
+        monitor, '_fetch_companies_batch',
+        lambda tickers, days_back, form_types, max_workers=8: [
+            _transaction_table(t) for t in tickers
+        ],
+    )
+
+    analysis = monitor.analyze_insider_patterns(days_back=30)
+
+    assert analysis['summary']['total_transactions'] == 2
+    ticker_lists = [value for key, value in analysis['by_insider'].items()
+                    if key[0] == 'company_ticker']
+    assert sorted(ticker_lists[0]['Jane Doe']) == ["AAPL", "MSFT"]